@@ -0,0 +1,36 @@
+"""
+Helper to load a .env file into os.environ.
+
+Shared by the standalone database scripts, which need the environment
+populated before Django settings are imported.
+"""
+import mmap
+import os
+import re
+
+ENV_LINE_RE = re.compile(
+    rb"(?m)^[ \t]*([A-Za-z_][A-Za-z0-9_]*)[ \t]*=[ \t]*"
+    rb"(?:\"([^\"\r\n]*)\"|'([^'\r\n]*)'|([^\r\n]*))"
+)
+
+
+def load_env(path):
+    """
+    Load KEY=value pairs from the file at path into os.environ.
+
+    Blank lines and comment lines are skipped and surrounding quotes are removed.
+    """
+    with open(path, "rb") as f:
+        # mmap refuses zero-length files
+        if os.fstat(f.fileno()).st_size == 0:
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            for match in ENV_LINE_RE.finditer(mm):
+                key, double_quoted, single_quoted, bare = match.groups()
+                if double_quoted is not None:
+                    value = double_quoted
+                elif single_quoted is not None:
+                    value = single_quoted
+                else:
+                    value = bare.strip()
+                os.environ[key.decode()] = value.decode("utf-8")
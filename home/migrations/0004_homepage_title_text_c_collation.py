@@ -0,0 +1,35 @@
+from django.db import migrations
+
+
+def set_title_text_collation(apps, schema_editor, collation):
+    # SQLite has no "C" collation (its default BINARY already compares bytes),
+    # so this only applies to Postgres.
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    HomePage = apps.get_model("home", "HomePage")
+    field = HomePage._meta.get_field("title_text")
+    quote_name = schema_editor.quote_name
+    schema_editor.execute(
+        f"ALTER TABLE {quote_name(HomePage._meta.db_table)} "
+        f"ALTER COLUMN {quote_name(field.column)} "
+        f'TYPE {field.db_type(schema_editor.connection)} COLLATE "{collation}"'
+    )
+
+
+def use_c_collation(apps, schema_editor):
+    set_title_text_collation(apps, schema_editor, "C")
+
+
+def use_default_collation(apps, schema_editor):
+    set_title_text_collation(apps, schema_editor, "default")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("home", "0003_homepage_title_text"),
+    ]
+
+    operations = [
+        migrations.RunPython(use_c_collation, use_default_collation),
+    ]
@@ -4,6 +4,10 @@ from wagtail.models import Page
 
 
 class HomePage(Page):
+    # On Postgres this column uses the "C" collation, applied by migration
+    # 0004_homepage_title_text_c_collation rather than db_collation (SQLite has
+    # no "C" collation). An AlterField on this field drops it again, so re-apply
+    # it in the same migration.
     title_text = models.CharField(
         max_length=255,
         blank=True,
@@ -14,18 +14,13 @@ from pathlib import Path
 BASE_DIR = Path(__file__).resolve().parent
 sys.path.insert(0, str(BASE_DIR))
 
+from env_loader import load_env  # noqa: E402
+
 # Try to load .env file if it exists
 env_file = BASE_DIR / ".env"
 if env_file.exists():
     print("Loading .env file...")
-    with open(env_file, "r", encoding="utf-8") as f:
-        for line in f:
-            line = line.strip()
-            if line and not line.startswith("#") and "=" in line:
-                key, value = line.split("=", 1)
-                # Remove quotes if present
-                value = value.strip('"').strip("'")
-                os.environ[key.strip()] = value
+    load_env(env_file)
     print("[OK] .env file loaded\n")
 
 # Setup Django
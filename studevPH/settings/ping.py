@@ -0,0 +1,7 @@
+from .dev import *
+
+# Minimal settings for test_neon_connection.py: only DATABASES is needed,
+# so skip registering Wagtail and the project apps.
+INSTALLED_APPS = []
+
+MIDDLEWARE = []
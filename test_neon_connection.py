@@ -6,80 +6,78 @@ This script will:
 2. Test the connection to Neon Postgres
 3. Display connection information
 """
+import logging
 import os
 import sys
 from pathlib import Path
+from urllib.parse import urlsplit, urlunsplit
+
+logger = logging.getLogger("test_neon_connection")
 
 # Add the project directory to Python path
 BASE_DIR = Path(__file__).resolve().parent
 sys.path.insert(0, str(BASE_DIR))
 
-# Try to load .env file if it exists
-env_file = BASE_DIR / ".env"
-if env_file.exists():
-    print("Loading .env file...")
-    with open(env_file, "r") as f:
-        for line in f:
-            line = line.strip()
-            if line and not line.startswith("#") and "=" in line:
-                key, value = line.split("=", 1)
-                # Remove quotes if present
-                value = value.strip('"').strip("'")
-                os.environ[key.strip()] = value
-    print("[OK] .env file loaded\n")
+from env_loader import load_env  # noqa: E402
+
+
+def setup_django():
+    """Load .env (if it exists) and set up Django with the ping settings."""
+    env_file = BASE_DIR / ".env"
+    if env_file.exists():
+        logger.info("Loading .env file...")
+        load_env(env_file)
+        logger.info("[OK] .env file loaded\n")
 
-# Setup Django
-os.environ.setdefault("DJANGO_SETTINGS_MODULE", "studevPH.settings.dev")
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "studevPH.settings.ping")
 
-try:
-    import django
+    try:
+        import django
+
+        django.setup()
+    except ImportError:
+        logger.error(
+            "[ERROR] Django is not installed. Please install dependencies:\n"
+            "  pip install -r requirements.txt"
+        )
+        sys.exit(1)
 
-    django.setup()
-except ImportError:
-    print("[ERROR] Django is not installed. Please install dependencies:")
-    print("  pip install -r requirements.txt")
-    sys.exit(1)
 
-from django.conf import settings  # noqa: E402
-from django.db import connection, connections  # noqa: E402
+def mask_database_url(database_url):
+    """Return database_url with its password hidden, or "[set]" if it has none."""
+    url_parts = urlsplit(database_url)
+    if not url_parts.password:
+        return "[set]"
+    host = url_parts.netloc.rpartition("@")[2]
+    return urlunsplit(url_parts._replace(netloc=f"{url_parts.username}:***@{host}"))
 
 
 def test_connection():
-    print("=" * 60)
-    print("Neon Database Connection Test")
-    print("=" * 60)
+    from django.conf import settings
+    from django.db import connection, connections
+
+    logger.info("=" * 60)
+    logger.info("Neon Database Connection Test")
+    logger.info("=" * 60)
 
     # Check if DATABASE_URL is set
     database_url = os.environ.get("DATABASE_URL")
     if not database_url:
-        print("\n[ERROR] DATABASE_URL environment variable is not set!")
-        print("Please set it in your .env file or environment variables.")
+        logger.error(
+            "\n[ERROR] DATABASE_URL environment variable is not set!\n"
+            "Please set it in your .env file or environment variables."
+        )
         return False
 
-    # Mask password in URL for display
-    if "@" in database_url and "://" in database_url:
-        parts = database_url.split("@")
-        if len(parts) == 2:
-            protocol_user_pass = parts[0]
-            if ":" in protocol_user_pass.split("://")[1]:
-                protocol, user_pass = protocol_user_pass.split("://")
-                user, _ = user_pass.split(":", 1)
-                masked_url = f"{protocol}://{user}:***@{parts[1]}"
-                print(f"\nDATABASE_URL: {masked_url}")
-            else:
-                print("\nDATABASE_URL: [set]")
-        else:
-            print("\nDATABASE_URL: [set]")
-    else:
-        print("\nDATABASE_URL: [set]")
+    logger.info(f"\nDATABASE_URL: {mask_database_url(database_url)}")
 
     # Display database configuration
     db_config = settings.DATABASES["default"]
     engine = db_config.get("ENGINE", "unknown")
 
-    print("\n" + "-" * 60)
-    print("Database Configuration:")
-    print("-" * 60)
+    logger.info("\n" + "-" * 60)
+    logger.info("Database Configuration:")
+    logger.info("-" * 60)
 
     if "postgresql" in engine or "postgres" in engine:
         db_type = "PostgreSQL (Neon)"
@@ -88,83 +86,80 @@ def test_connection():
         name = db_config.get("NAME", "N/A")
         user = db_config.get("USER", "N/A")
 
-        print(f"Type: {db_type}")
-        print(f"Host: {host}")
-        print(f"Port: {port}")
-        print(f"Database: {name}")
-        print(f"User: {user}")
+        logger.info(f"Type: {db_type}")
+        logger.info(f"Host: {host}")
+        logger.info(f"Port: {port}")
+        logger.info(f"Database: {name}")
+        logger.info(f"User: {user}")
     elif "sqlite" in engine:
-        print("Type: SQLite")
-        print(f"Database: {db_config.get('NAME', 'N/A')}")
-        print("\n[WARNING] Currently using SQLite, not Neon Postgres!")
-        print("Make sure DATABASE_URL is set correctly.")
+        logger.info("Type: SQLite")
+        logger.info(f"Database: {db_config.get('NAME', 'N/A')}")
+        logger.warning(
+            "\n[WARNING] Currently using SQLite, not Neon Postgres!\n"
+            "Make sure DATABASE_URL is set correctly."
+        )
         return False
     else:
-        print(f"Type: {engine}")
+        logger.info(f"Type: {engine}")
 
     # Test connection
-    print("\n" + "-" * 60)
-    print("Testing Connection...")
-    print("-" * 60)
+    logger.info("\n" + "-" * 60)
+    logger.info("Testing Connection...")
+    logger.info("-" * 60)
 
     try:
         # Ensure connection
         db = connections["default"]
         db.ensure_connection()
-        print("[OK] Connection established successfully!")
+        logger.info("[OK] Connection established successfully!")
 
-        # Get database version
+        # Fetch everything in a single round trip
         with connection.cursor() as cursor:
-            cursor.execute("SELECT version();")
-            version = cursor.fetchone()[0]
-            print("\n[OK] Database Version:")
-            print(f"  {version}")
-
-            # Test a simple query
-            cursor.execute("SELECT 1 as test_value, current_database() as db_name, current_user as db_user;")
-            result = cursor.fetchone()
-            if result:
-                print("\n[OK] Query test passed!")
-                print(f"  Test Value: {result[0]}")
-                print(f"  Database Name: {result[1]}")
-                print(f"  Database User: {result[2]}")
-
-            # Get some database info
-            cursor.execute("SELECT current_database(), version();")
-            db_info = cursor.fetchone()
-            print("\n[OK] Connection Details:")
-            print(f"  Connected to: {db_info[0]}")
-            print(f"  PostgreSQL Version: {db_info[1].split(',')[0]}")
-
-        print("\n" + "=" * 60)
-        print("[OK] Connection test completed successfully!")
-        print("=" * 60)
+            cursor.execute("SELECT version(), current_database(), current_user, 1 as test_value;")
+            version, db_name, db_user, test_value = cursor.fetchone()
+
+        logger.info("\n[OK] Database Version:")
+        logger.info(f"  {version}")
+
+        logger.info("\n[OK] Query test passed!")
+        logger.info(f"  Test Value: {test_value}")
+        logger.info(f"  Database Name: {db_name}")
+        logger.info(f"  Database User: {db_user}")
+
+        logger.info("\n[OK] Connection Details:")
+        logger.info(f"  Connected to: {db_name}")
+        logger.info(f"  PostgreSQL Version: {version.split(',')[0]}")
+
+        logger.info("\n" + "=" * 60)
+        logger.info("[OK] Connection test completed successfully!")
+        logger.info("=" * 60)
         return True
 
     except Exception as e:
-        print("\n[ERROR] Connection failed!")
-        print(f"  Error: {str(e)}")
-        print("\n" + "-" * 60)
-        print("Troubleshooting:")
-        print("-" * 60)
-        print("1. Check if DATABASE_URL is correct")
-        print("2. Verify your Neon database is running")
-        print("3. Check network connectivity")
-        print("4. Ensure SSL is properly configured")
-        print("5. Verify credentials are correct")
+        logger.error(
+            "\n[ERROR] Connection failed!\n"
+            f"  Error: {str(e)}\n"
+            "\n" + "-" * 60 + "\n"
+            "Troubleshooting:\n" + "-" * 60 + "\n"
+            "1. Check if DATABASE_URL is correct\n"
+            "2. Verify your Neon database is running\n"
+            "3. Check network connectivity\n"
+            "4. Ensure SSL is properly configured\n"
+            "5. Verify credentials are correct"
+        )
         return False
 
 
 if __name__ == "__main__":
+    # Status output goes through one logger, configured once for the script
+    logging.basicConfig(level=logging.INFO, format="%(message)s", stream=sys.stdout)
+    setup_django()
     try:
         success = test_connection()
         sys.exit(0 if success else 1)
     except KeyboardInterrupt:
-        print("\n\nTest cancelled by user.")
+        logger.info("\n\nTest cancelled by user.")
         sys.exit(1)
     except Exception as e:
-        print(f"\n[ERROR] Unexpected error: {e}")
-        import traceback
-
-        traceback.print_exc()
+        logger.exception(f"\n[ERROR] Unexpected error: {e}")
         sys.exit(1)
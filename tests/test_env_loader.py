@@ -0,0 +1,60 @@
+import os
+import tempfile
+from unittest import mock
+
+from django.test import SimpleTestCase
+
+from env_loader import load_env
+
+
+class LoadEnvTests(SimpleTestCase):
+    """
+    Tests for loading .env files into os.environ.
+    """
+
+    def load(self, content):
+        """
+        Write content to a temporary .env file, load it and return os.environ.
+        """
+        with tempfile.NamedTemporaryFile("wb", suffix=".env", delete=False) as f:
+            f.write(content)
+        self.addCleanup(os.unlink, f.name)
+        load_env(f.name)
+        return os.environ
+
+    def setUp(self):
+        patcher = mock.patch.dict(os.environ)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_quoted_values(self):
+        env = self.load(b"DOUBLE=\"a b\"\nSINGLE='c d'\nEMPTY=\"\"\n")
+        self.assertEqual(env["DOUBLE"], "a b")
+        self.assertEqual(env["SINGLE"], "c d")
+        self.assertEqual(env["EMPTY"], "")
+
+    def test_bare_values_are_stripped(self):
+        env = self.load(b"  BARE =  value with spaces  \nBLANK=\n")
+        self.assertEqual(env["BARE"], "value with spaces")
+        self.assertEqual(env["BLANK"], "")
+
+    def test_comment_lines_are_skipped(self):
+        env = self.load(b"# COMMENTED=1\n\n   # INDENTED=2\nKEPT=3\n")
+        self.assertNotIn("COMMENTED", env)
+        self.assertNotIn("INDENTED", env)
+        self.assertEqual(env["KEPT"], "3")
+
+    def test_empty_file(self):
+        before = dict(os.environ)
+        self.load(b"")
+        self.assertEqual(dict(os.environ), before)
+
+    def test_crlf_line_endings(self):
+        env = self.load(b"FIRST=one\r\nSECOND=\"two\"\r\n")
+        self.assertEqual(env["FIRST"], "one")
+        self.assertEqual(env["SECOND"], "two")
+
+    def test_value_containing_equals_and_hash(self):
+        env = self.load(b"KEY=a=b\nURL=postgresql://u:p@h/db?sslmode=require#x\n")
+        self.assertEqual(env["KEY"], "a=b")
+        self.assertEqual(env["URL"], "postgresql://u:p@h/db?sslmode=require#x")
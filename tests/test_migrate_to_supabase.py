@@ -0,0 +1,193 @@
+import sqlite3
+
+from django.db import connection
+from django.db.backends.postgresql.base import DatabaseWrapper
+from django.test import SimpleTestCase
+
+from wagtail.models import Site, TaskState, WorkflowState
+
+from migrate_to_supabase import CopyRowStream, get_model_layers, insert_template, pgloader_command, require_ssl
+
+
+def parse_copy_text(data):
+    """
+    Decode COPY text format back into rows of strings and None.
+    """
+    unescape = {"\\": "\\", "t": "\t", "n": "\n", "r": "\r"}
+    rows = []
+    for line in data.split("\n")[:-1]:
+        row = []
+        for field in line.split("\t"):
+            if field == "\\N":
+                row.append(None)
+                continue
+            value, chars = [], iter(field)
+            for char in chars:
+                value.append(unescape[next(chars)] if char == "\\" else char)
+            row.append("".join(value))
+        rows.append(row)
+    return rows
+
+
+class CopyRowStreamTests(SimpleTestCase):
+    """
+    Tests for encoding SQLite rows for COPY FROM STDIN.
+    """
+
+    rows = [
+        (1, "plain", None, b"\x00\xff"),
+        (2, "\\N", "", None),
+        (3, "tab\there", "new\nline\r", b""),
+        (4, "back\\slash", "1.5", b"\x10"),
+    ]
+
+    def setUp(self):
+        self.sqlite_conn = sqlite3.connect(":memory:")
+        self.addCleanup(self.sqlite_conn.close)
+        self.sqlite_conn.execute("CREATE TABLE t (id INTEGER, a TEXT, b TEXT, c BLOB)")
+        self.sqlite_conn.executemany("INSERT INTO t VALUES (?, ?, ?, ?)", self.rows)
+
+    def stream(self, arraysize=2):
+        source = self.sqlite_conn.cursor()
+        source.arraysize = arraysize
+        source.execute("SELECT id, a, b, c FROM t ORDER BY id")
+        return CopyRowStream(source)
+
+    def read_all(self, stream, size):
+        chunks = []
+        while True:
+            chunk = stream.read(size)
+            if not chunk:
+                return "".join(chunks)
+            chunks.append(chunk)
+
+    def test_round_trip(self):
+        stream = self.stream()
+        decoded = parse_copy_text(self.read_all(stream, 8192))
+
+        expected = [
+            [str(row_id), a, b, None if c is None else "\\x" + c.hex()]
+            for row_id, a, b, c in self.rows
+        ]
+        self.assertEqual(decoded, expected)
+        self.assertEqual(stream.count, len(self.rows))
+
+    def test_text_null_marker_is_not_null(self):
+        decoded = parse_copy_text(self.read_all(self.stream(), 8192))
+        self.assertEqual(decoded[1][1], "\\N")
+        self.assertIsNone(decoded[1][3])
+
+    def test_small_reads_match_whole_batches(self):
+        self.assertEqual(
+            self.read_all(self.stream(), 3),
+            self.read_all(self.stream(arraysize=100), -1),
+        )
+
+
+class GetModelLayersTests(SimpleTestCase):
+    """
+    Tests for grouping models into foreign key dependency layers.
+    """
+
+    def setUp(self):
+        self.layers = get_model_layers()
+        self.layer_of = {model: index for index, layer in enumerate(self.layers) for model in layer}
+
+    def test_every_model_once(self):
+        models = [model for layer in self.layers for model in layer]
+        self.assertEqual(len(models), len(set(models)))
+
+    def test_foreign_key_targets_load_first(self):
+        cycle = {WorkflowState, TaskState}
+        for model, index in self.layer_of.items():
+            for field in model._meta.local_concrete_fields:
+                target = field.related_model
+                if not field.is_relation or target not in self.layer_of or target is model:
+                    continue
+                if model in cycle and target in cycle:
+                    continue
+                with self.subTest(model=model._meta.label, target=target._meta.label):
+                    self.assertLess(self.layer_of[target], index)
+
+    def test_cycle_loads_together(self):
+        # WorkflowState.current_task_state and TaskState.workflow_state point at each other
+        self.assertEqual(self.layer_of[WorkflowState], self.layer_of[TaskState])
+        self.assertEqual(self.layer_of[WorkflowState], len(self.layers) - 1)
+
+
+class RequireSslTests(SimpleTestCase):
+    """
+    Tests for forcing sslmode on the URL handed to pgloader.
+    """
+
+    def test_adds_sslmode(self):
+        self.assertEqual(
+            require_ssl("postgresql://u:p@host:5432/db"),
+            "postgresql://u:p@host:5432/db?sslmode=require",
+        )
+
+    def test_overrides_weaker_sslmode_and_keeps_other_options(self):
+        self.assertEqual(
+            require_ssl("postgresql://u:p@host/db?sslmode=disable&options=x"),
+            "postgresql://u:p@host/db?sslmode=require&options=x",
+        )
+
+    def test_keeps_verify_modes(self):
+        url = "postgresql://u:p@host/db?sslmode=verify-full"
+        self.assertEqual(require_ssl(url), url)
+
+
+class PgloaderCommandTests(SimpleTestCase):
+    """
+    Tests for the pgloader command file contents.
+    """
+
+    def test_command(self):
+        command = pgloader_command(
+            "/app/db.sqlite3",
+            "postgresql://u:p@host/db",
+            ["auth_group", "home_homepage"],
+            {"auth_group", "home_homepage", "django_migrations"},
+        )
+        self.assertEqual(
+            command,
+            "LOAD DATABASE\n"
+            "    FROM sqlite:///app/db.sqlite3\n"
+            "    INTO postgresql://u:p@host/db?sslmode=require\n"
+            "WITH data only, reset no sequences\n"
+            "SET PostgreSQL PARAMETERS session_replication_role to 'replica'\n"
+            "INCLUDING ONLY TABLE NAMES LIKE 'auth_group', 'home_homepage';\n",
+        )
+
+    def test_excludes_tables_matched_by_underscore_wildcard(self):
+        command = pgloader_command(
+            "/app/db.sqlite3",
+            "postgresql://u:p@host/db",
+            ["auth_group"],
+            {"auth_group", "authXgroup", "AUTH_GROUP_extra"},
+        )
+        self.assertIn("\nEXCLUDING TABLE NAMES LIKE 'authXgroup';\n", command)
+
+    def test_ambiguous_tables_are_refused(self):
+        # SQLite's LIKE ignores case, so excluding "authxgroup" would also drop "AUTHXGROUP"
+        with self.assertRaises(Exception):
+            pgloader_command(
+                "/app/db.sqlite3",
+                "postgresql://u:p@host/db",
+                ["auth_group", "AUTHXGROUP"],
+                {"auth_group", "AUTHXGROUP", "authxgroup"},
+            )
+
+
+class InsertTemplateTests(SimpleTestCase):
+    """
+    Tests for the multi-row INSERT template casting SQLite values.
+    """
+
+    def test_casts_every_column_to_its_postgres_type(self):
+        postgres = DatabaseWrapper({**connection.settings_dict, "ENGINE": "django.db.backends.postgresql"})
+        fields = [Site._meta.get_field(name) for name in ("id", "hostname", "port", "root_page", "is_default_site")]
+        self.assertEqual(
+            insert_template(fields, postgres),
+            "(%s::integer, %s::varchar(255), %s::integer, %s::integer, %s::boolean)",
+        )